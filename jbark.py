@@ -2,38 +2,398 @@
 
 import librosa
 import numpy as np
+import torch
+import torch.multiprocessing as mp
+import torch.nn.functional as F
 from bark import SAMPLE_RATE, generate_audio, preload_models
-from scipy.io import wavfile
+from bark import generation as bark_generation
+from bark.api import semantic_to_waveform
+from bark.generation import (
+    SEMANTIC_INFER_TOKEN,
+    SEMANTIC_PAD_TOKEN,
+    SEMANTIC_VOCAB_SIZE,
+    TEXT_ENCODING_OFFSET,
+    TEXT_PAD_TOKEN,
+    _load_history_prompt,
+    _normalize_whitespace,
+    _tokenize,
+    generate_text_semantic,
+)
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from numba import njit
+import os
+import resampy
+import soundfile as sf
+import threading
 import warnings
 
+# Bark keeps its weights in module-level state, so they only need loading once per process;
+# _loaded_small is None until then, afterwards whether the small checkpoints were loaded
+_models_lock = threading.Lock()
+_loaded_small = None
+_models_compiled = False
+
+def _bark_modules():
+    # Bark stores the text model as {"model": ..., "tokenizer": ...}; the others are bare modules
+    for model in bark_generation.models.values():
+        if isinstance(model, dict):
+            model = model.get("model")
+        if isinstance(model, torch.nn.Module):
+            yield model
+
+def _compile_bark_models():
+    # Only the GPT stages are worth compiling; the codec is driven through its submodules,
+    # which would bypass a compiled forward anyway
+    for key in ("text", "coarse", "fine"):
+        if key == "text":
+            container = bark_generation.models[key]
+            container["model"] = torch.compile(container["model"], mode="reduce-overhead", fullgraph=False)
+        else:
+            bark_generation.models[key] = torch.compile(bark_generation.models[key], mode="reduce-overhead", fullgraph=False)
+
+@lru_cache(maxsize=None)
+def _pause_buffer(pause_duration):
+    # Shared between calls, so hand it out read-only
+    pause = np.zeros(int(pause_duration * SAMPLE_RATE), dtype=np.int16)
+    pause.setflags(write=False)
+    return pause
+
+@lru_cache(maxsize=64)
+def _encoded_prompt(prompt):
+    # Load a voice preset (or .npz path) once; the arrays are shared between calls, so make them read-only
+    history_prompt = _load_history_prompt(prompt)
+    encoded = {}
+    for key in ("semantic_prompt", "coarse_prompt", "fine_prompt"):
+        encoded[key] = np.array(history_prompt[key])
+        encoded[key].setflags(write=False)
+    return encoded
+
+def _resolve_history_prompt(history_prompt):
+    # Bark accepts the loaded dict in place of a preset name, which skips reloading the .npz
+    if isinstance(history_prompt, str):
+        return _encoded_prompt(history_prompt)
+    return history_prompt
+
+def _pin_local_gpu():
+    # Under a distributed launcher (accelerate launch, torchrun) select this process's own GPU before
+    # Bark loads onto plain "cuda", so the ranks don't all stage their weights on cuda:0
+    local_rank = os.environ.get("LOCAL_RANK")
+    if local_rank is not None and torch.cuda.is_available():
+        torch.cuda.set_device(int(local_rank))
+
+def _init_worker(small=False, num_threads=None, compile=False):
+    global _models_compiled
+    JBark.configure(num_threads)
+    _pin_local_gpu()
+    # Forked workers inherit the parent's (possibly compiled) weights and Bark skips the load;
+    # spawned ones start from scratch and load and compile their own
+    preload_models(text_use_small=small, coarse_use_small=small, fine_use_small=small)
+    if compile and not _models_compiled:
+        _compile_bark_models()
+        _models_compiled = True
+
+def _gen_chunk(text, history_prompt=None):
+    history_prompt = _resolve_history_prompt(history_prompt)
+    semantic_tokens = generate_text_semantic(text, history_prompt=history_prompt, silent=True, use_kv_caching=True)
+    return semantic_to_waveform(semantic_tokens, history_prompt=history_prompt, silent=True)
+
+def _semantic_inputs(texts, history_prompt=None):
+    # Bark's text model always sees 256 text tokens, 256 history tokens and one infer token,
+    # so every prompt has the same length and the batch needs no attention mask
+    tokenizer = bark_generation.models["text"]["tokenizer"]
+    if history_prompt is not None:
+        semantic_history = _load_history_prompt(history_prompt)["semantic_prompt"].astype(np.int64)[-256:]
+    else:
+        semantic_history = np.empty(0, dtype=np.int64)
+    
+    x = np.empty((len(texts), 256 + 256 + 1), dtype=np.int64)
+    x[:, 256:512] = SEMANTIC_PAD_TOKEN
+    x[:, 256:256 + len(semantic_history)] = semantic_history
+    x[:, 512] = SEMANTIC_INFER_TOKEN
+    for row, text in zip(x, texts):
+        text = _normalize_whitespace(text)
+        if not text:
+            raise ValueError("Text prompts must not be empty")
+        encoded_text = np.array(_tokenize(tokenizer, text), dtype=np.int64)[:256] + TEXT_ENCODING_OFFSET
+        row[:len(encoded_text)] = encoded_text
+        row[len(encoded_text):256] = TEXT_PAD_TOKEN
+    
+    return torch.from_numpy(x)
+
+def _generate_text_semantic_batched(x, temp=0.7, min_eos_p=0.2, max_steps=768, use_kv_caching=True):
+    # Batched port of bark.generation.generate_text_semantic: every row is sampled on each step,
+    # rows that have hit EOS keep being fed the pad token and are trimmed to their own length
+    model = bark_generation.models["text"]["model"]
+    if bark_generation.OFFLOAD_CPU:
+        model.to(bark_generation.models_devices["text"])
+    device = next(model.parameters()).device
+    n_prefix = x.shape[1]
+    lengths = [max_steps] * len(x)
+    
+    with bark_generation._inference_mode():
+        x = x.to(device)
+        done = torch.zeros(len(x), dtype=torch.bool, device=device)
+        kv_cache = None
+        for n in range(max_steps):
+            x_input = x[:, [-1]] if use_kv_caching and kv_cache is not None else x
+            logits, kv_cache = model(x_input, merge_context=True, use_cache=use_kv_caching, past_kv=kv_cache)
+            relevant_logits = torch.cat((logits[:, 0, :SEMANTIC_VOCAB_SIZE], logits[:, 0, [SEMANTIC_PAD_TOKEN]]), dim=-1)
+            probs = F.softmax(relevant_logits / temp, dim=-1)
+            # Like Bark, sample on the CPU when running on MPS, where multinomial is unreliable
+            if probs.device.type == "mps":
+                item_next = torch.multinomial(probs.to("cpu"), num_samples=1).to(probs.device)
+            else:
+                item_next = torch.multinomial(probs, num_samples=1)
+            
+            eos = (item_next[:, 0] == SEMANTIC_VOCAB_SIZE) | (probs[:, -1] >= min_eos_p)
+            for i in torch.nonzero(eos & ~done).flatten().tolist():
+                lengths[i] = n
+            done |= eos
+            if done.all():
+                break
+            
+            item_next[done] = SEMANTIC_PAD_TOKEN
+            x = torch.cat((x, item_next), dim=1)
+        
+        out = x.detach().cpu().numpy()
+    
+    if bark_generation.OFFLOAD_CPU:
+        model.to("cpu")
+    return [row[n_prefix:n_prefix + length] for row, length in zip(out, lengths)]
+
+@njit(cache=True)
+def _sola_stretch(x, rate, frame=1024, hop=256, tolerance=128, decimate=4):
+    # Synchronous overlap-add: output frames are read from the input every hop * rate samples,
+    # each nudged by up to `tolerance` samples to line up with the continuation of the frame before it
+    n_out = int(len(x) / rate)
+    if len(x) < frame:
+        x = np.concatenate((x, np.zeros(frame - len(x), dtype=x.dtype)))
+    n_frames = n_out // hop + 1
+    overlap = frame - hop
+    last_start = len(x) - frame
+    
+    starts = np.zeros(n_frames, dtype=np.int64)
+    for k in range(1, n_frames):
+        nominal = int(k * hop * rate)
+        ref = min(starts[k - 1] + hop, last_start)
+        lo = max(0, nominal - tolerance)
+        hi = min(last_start, nominal + tolerance)
+        if lo > hi:
+            starts[k] = min(max(nominal, 0), last_start)
+            continue
+        
+        # Coarse pass over every `decimate`-th candidate, then refine around the best one;
+        # both correlate every `decimate`-th sample of the overlap, which is plenty for alignment
+        best_start = lo
+        best_corr = 0.0
+        for start in range(lo, hi + 1, decimate):
+            total = 0.0
+            for i in range(0, overlap, decimate):
+                total += x[start + i] * x[ref + i]
+            if start == lo or total > best_corr:
+                best_corr = total
+                best_start = start
+        coarse_start = best_start
+        for start in range(max(lo, coarse_start - decimate + 1), min(hi, coarse_start + decimate - 1) + 1):
+            total = 0.0
+            for i in range(0, overlap, decimate):
+                total += x[start + i] * x[ref + i]
+            if total > best_corr:
+                best_corr = total
+                best_start = start
+        starts[k] = best_start
+    
+    window = np.hanning(frame).astype(x.dtype)
+    out = np.zeros(n_frames * hop + frame, dtype=x.dtype)
+    norm = np.zeros(n_frames * hop + frame, dtype=x.dtype)
+    for k in range(n_frames):
+        for i in range(frame):
+            out[k * hop + i] += x[starts[k] + i] * window[i]
+            norm[k * hop + i] += window[i]
+    for i in range(len(out)):
+        if norm[i] > 1e-3:
+            out[i] /= norm[i]
+    
+    return out[:n_out]
+
 class JBark:
-    def __init__(self):
+    def __init__(self, num_workers=1, small=False, backend="python", compile=False, num_threads=None):
         print("Using CPU for computations.")
         self.SAMPLE_RATE = SAMPLE_RATE
+        self.num_workers = num_workers
+        self.num_threads = num_threads
+        self.small = small
+        self.backend = backend
+        self.compile = compile
+        self._pool = None
         self._suppress_warnings()
-        self.preload_models()
+        self.configure(num_threads)
+        
+        if backend == "python":
+            self._generate = generate_audio
+            self.preload_models()
+        elif backend == "cpp":
+            try:
+                import bark_cpp
+            except ImportError as e:
+                raise ImportError("backend='cpp' requires the bark_cpp bindings to be installed") from e
+            self._generate = bark_cpp.generate_audio
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+
+    @classmethod
+    def configure(cls, num_threads=None):
+        """
+        Limit the number of threads PyTorch and the BLAS libraries use.
+        
+        The BLAS environment variables are only read when a library starts up, so they apply to
+        processes started afterwards (such as the generate_long_audio workers); call this before
+        importing numpy or torch to cover the current process as well.
+        
+        :param num_threads: Number of threads to use (None leaves the defaults alone)
+        """
+        if num_threads is None:
+            return
+        
+        for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+            os.environ[var] = str(num_threads)
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once, before any inter-op parallel work has started
+            pass
 
     def _suppress_warnings(self):
         warnings.filterwarnings("ignore", category=FutureWarning)
         warnings.filterwarnings("ignore", message="You are using `torch.load`")
         warnings.filterwarnings("ignore", message="`clean_up_tokenization_spaces` was not set")
         warnings.filterwarnings("ignore", message="`torch.nn.utils.weight_norm` is deprecated")
+        # Installed once here rather than around every call: silence whatever else the libraries
+        # jBark drives raise, without hiding warnings from the caller's own code
+        for module in ("bark", "encodec", "torch", "transformers"):
+            warnings.filterwarnings("ignore", module=module)
 
     def preload_models(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            preload_models()
+        global _loaded_small, _models_compiled
+        with _models_lock:
+            if _loaded_small != self.small:
+                _pin_local_gpu()
+                preload_models(
+                    text_use_small=self.small,
+                    coarse_use_small=self.small,
+                    fine_use_small=self.small,
+                    force_reload=_loaded_small is not None,
+                )
+                _loaded_small = self.small
+                _models_compiled = False
+            
+            # Compiling happens lazily on the first call of each model, so this step itself is cheap
+            if self.compile and not _models_compiled:
+                if not hasattr(torch, "compile"):
+                    raise RuntimeError("compile=True requires PyTorch 2.0 or later")
+                _compile_bark_models()
+                _models_compiled = True
+
+    def _get_pool(self):
+        if self._pool is None:
+            # CUDA can't be re-initialized in a forked child, so once Bark runs on the GPU (resident,
+            # offloaded to CPU between calls, or CUDA merely initialized here) workers must be spawned
+            # and load their own copy; on the CPU the platform default is fine, and forked workers
+            # share the weights
+            on_cuda = (
+                torch.cuda.is_initialized()
+                or any(torch.device(d).type == "cuda" for d in bark_generation.models_devices.values())
+                or any(p.is_cuda for module in _bark_modules() for p in module.parameters())
+            )
+            if on_cuda:
+                context = mp.get_context("spawn")
+            else:
+                context = mp.get_context()
+                for module in _bark_modules():
+                    module.share_memory()
+            # Split the cores between workers unless told otherwise, so they don't oversubscribe the CPU
+            num_threads = self.num_threads or max(1, (os.cpu_count() or 1) // self.num_workers)
+            self._pool = context.Pool(
+                self.num_workers,
+                initializer=_init_worker,
+                initargs=(self.small, num_threads, self.compile),
+            )
+        return self._pool
 
+    def close(self):
+        """
+        Shut down the worker pool used by generate_long_audio, if one was started.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @torch.inference_mode()
     def generate_audio(self, text_prompt, output_path=None, history_prompt=None):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            audio_array = generate_audio(text_prompt, history_prompt=history_prompt)
+        """
+        Generate audio from text using Bark.
+        
+        :param text_prompt: The text to convert to speech
+        :param output_path: Path to save the generated audio (optional)
+        :param history_prompt: Voice preset to use (optional)
+        :return: Audio array
+        """
+        if self.backend == "python":
+            history_prompt = _resolve_history_prompt(history_prompt)
+        
+        audio_array = self._generate(text_prompt, history_prompt=history_prompt)
         
         if output_path:
-            wavfile.write(output_path, self.SAMPLE_RATE, audio_array)
+            self.save_audio(audio_array, output_path)
         
         return audio_array
 
+    def generate_audio_batch(self, texts, history_prompt=None, batch_size=None):
+        """
+        Generate audio for several texts, running Bark's text-to-semantic pass on them in batches.
+        
+        :param texts: List of texts to convert to speech
+        :param history_prompt: Voice preset to use for every text (optional)
+        :param batch_size: Number of texts per batch (optional; all texts in one batch by default)
+        :return: List of audio arrays, one per text
+        """
+        return list(self._iter_audio_batch(texts, history_prompt, batch_size=batch_size))
+
+    @torch.inference_mode()
+    def _iter_audio_batch(self, texts, history_prompt=None, batch_size=None):
+        # Yields each waveform as soon as it is decoded, so callers can consume them one at a time
+        if not texts:
+            return
+        if self.backend != "python":
+            for text in texts:
+                yield self.generate_audio(text, history_prompt=history_prompt)
+            return
+        
+        history_prompt = _resolve_history_prompt(history_prompt)
+        batch_size = batch_size or len(texts)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        
+        # Tokenize the next batch on a background thread while the current one generates;
+        # torch releases the GIL inside its kernels, so the two overlap
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(_semantic_inputs, batches[0], history_prompt)
+            for i in range(len(batches)):
+                x = pending.result()
+                if i + 1 < len(batches):
+                    pending = prefetcher.submit(_semantic_inputs, batches[i + 1], history_prompt)
+                
+                for semantic_tokens in _generate_text_semantic_batched(x):
+                    yield semantic_to_waveform(semantic_tokens, history_prompt=history_prompt)
+
     def concatenate_sentence_segments(self, segments, pause_duration=0.1):
         """
         Concatenate multiple audio segments into a single sentence.
@@ -43,10 +403,7 @@ class JBark:
         :return: Concatenated audio array
         """
         pause_samples = int(pause_duration * SAMPLE_RATE)
-        pause = np.zeros(pause_samples, dtype=np.int16)
-        
-        concatenated = np.concatenate([seg for pair in zip(segments, [pause] * len(segments)) for seg in pair])
-        return concatenated[:-pause_samples]  # Remove the last pause
+        return self._join_with_pauses(segments, pause_samples)
 
     def create_conversation(self, audio_segments, speaker_pause=0.5):
         """
@@ -57,10 +414,57 @@ class JBark:
         :return: Concatenated audio array of the full conversation
         """
         speaker_pause_samples = int(speaker_pause * SAMPLE_RATE)
-        speaker_pause = np.zeros(speaker_pause_samples, dtype=np.int16)
+        return self._join_with_pauses(audio_segments, speaker_pause_samples)
+
+    def _join_with_pauses(self, segments, pause_samples):
+        # Fill one preallocated buffer instead of concatenating segment/pause pairs;
+        # the pause regions are left as the buffer's zeros.
+        dtype = np.result_type(*segments, np.int16)
+        lengths = [len(seg) for seg in segments]
+        total = sum(lengths) + pause_samples * max(len(segments) - 1, 0)
+        joined = np.zeros(total, dtype=dtype)
+        
+        start = 0
+        for seg, length in zip(segments, lengths):
+            joined[start:start + length] = seg
+            start += length + pause_samples
         
-        conversation = np.concatenate([seg for pair in zip(audio_segments, [speaker_pause] * len(audio_segments)) for seg in pair])
-        return conversation[:-speaker_pause_samples]  # Remove the last pause
+        return joined
+
+    def _gather_segments(self, segments, pause_duration=0.1, size_hint=0, output_path=None):
+        # Copy each segment into one growing buffer as it arrives (and stream it to output_path),
+        # so finished segments never pile up in a list waiting to be concatenated. The buffer is
+        # zero-filled, which leaves the pauses in place, and doubles whenever it runs out.
+        pause_samples = int(pause_duration * SAMPLE_RATE)
+        writer = sf.SoundFile(output_path, 'w', SAMPLE_RATE, 1, 'PCM_16') if output_path else None
+        buffer = None
+        end = 0
+        
+        try:
+            for seg in segments:
+                if buffer is None:
+                    buffer = np.zeros(max(size_hint, len(seg)), dtype=np.result_type(seg, np.int16))
+                    start = 0
+                else:
+                    start = end + pause_samples
+                    if writer:
+                        writer.write(_pause_buffer(pause_duration))
+                
+                if start + len(seg) > len(buffer):
+                    grown = np.zeros(max(start + len(seg), 2 * len(buffer)), dtype=buffer.dtype)
+                    grown[:end] = buffer[:end]
+                    buffer = grown
+                end = start + len(seg)
+                buffer[start:end] = seg
+                if writer:
+                    writer.write(seg)
+        finally:
+            if writer:
+                writer.close()
+        
+        if buffer is None:
+            return np.zeros(0, dtype=np.int16)
+        return buffer[:end]
 
     def save_audio(self, audio_array, output_path):
         """
@@ -69,9 +473,25 @@ class JBark:
         :param audio_array: The audio array to save
         :param output_path: The path where the WAV file should be saved
         """
-        wavfile.write(output_path, SAMPLE_RATE, audio_array)
+        sf.write(output_path, audio_array, SAMPLE_RATE, subtype='PCM_16')
+
+    def save_audio_segments(self, segments, output_path, pause_duration=0.1):
+        """
+        Save audio segments to a WAV file with pauses between them, writing one segment at a time.
+        
+        :param segments: Iterable of audio arrays to save
+        :param output_path: The path where the WAV file should be saved
+        :param pause_duration: Duration of pause between segments in seconds
+        """
+        pause = _pause_buffer(pause_duration)
+        
+        with sf.SoundFile(output_path, 'w', SAMPLE_RATE, 1, 'PCM_16') as f:
+            for i, seg in enumerate(segments):
+                if i:
+                    f.write(pause)
+                f.write(seg)
 
-    def generate_long_audio(self, text, output_path=None, history_prompt=None, max_length=100):
+    def generate_long_audio(self, text, output_path=None, history_prompt=None, max_length=100, batch_size=8):
         """
         Generate audio for long text by splitting it into smaller chunks.
         
@@ -79,61 +499,190 @@ class JBark:
         :param output_path: Path to save the generated audio (optional)
         :param history_prompt: Voice preset to use (optional)
         :param max_length: Maximum length of each text chunk
+        :param batch_size: Number of chunks generated together in one batch
         :return: Audio array of the full text
         """
         chunks = self._split_long_text(text, max_length)
-        audio_segments = []
         
-        for chunk in chunks:
-            audio_segment = self.generate_audio(chunk, history_prompt=history_prompt)
-            audio_segments.append(audio_segment)
+        if self.num_workers > 1 and self.backend == "python":
+            # imap (rather than imap_unordered) keeps the segments in text order
+            audio_segments = self._get_pool().imap(partial(_gen_chunk, history_prompt=history_prompt), chunks)
+        else:
+            audio_segments = self._iter_audio_batch(chunks, history_prompt=history_prompt, batch_size=batch_size)
         
-        full_audio = self.concatenate_sentence_segments(audio_segments)
+        # Bark speaks roughly 14 characters a second; the buffer grows if that falls short
+        size_hint = len(text) * SAMPLE_RATE // 14
+        return self._gather_segments(audio_segments, size_hint=size_hint, output_path=output_path)
+
+    def generate_long_audio_distributed(self, text, output_path=None, history_prompt=None, max_length=100, batch_size=8):
+        """
+        Generate audio for long text with the chunks spread across GPUs.
         
-        if output_path:
-            self.save_audio(full_audio, output_path)
+        Run the calling script with `accelerate launch`: each process generates its share of the chunks
+        on its own GPU, the segments are gathered back in text order and only the main process saves the file.
         
-        return full_audio
+        :param text: The long text to convert to speech
+        :param output_path: Path to save the generated audio (optional)
+        :param history_prompt: Voice preset to use (optional)
+        :param max_length: Maximum length of each text chunk
+        :param batch_size: Number of chunks each process generates together in one batch
+        :return: Audio array of the full text
+        """
+        from accelerate import Accelerator
+        from accelerate.utils import gather_object
+        
+        accelerator = Accelerator()
+        # preload_models already loaded this rank's weights onto its own GPU (via LOCAL_RANK). With
+        # SUNO_OFFLOAD_CPU Bark parks the models on the CPU and moves each one to models_devices[key]
+        # for every call, so point that mapping at the rank's GPU explicitly as well
+        for key in bark_generation.models:
+            bark_generation.models_devices[key] = accelerator.device
+        
+        chunks = self._split_long_text(text, max_length)
+        with accelerator.split_between_processes(chunks) as local_chunks:
+            local_segments = list(self._iter_audio_batch(local_chunks, history_prompt, batch_size=batch_size))
+        audio_segments = gather_object(local_segments)
+        
+        if output_path and accelerator.is_main_process:
+            self.save_audio_segments(audio_segments, output_path)
+        
+        return self.concatenate_sentence_segments(audio_segments)
+
+    def simple_voice_clone(self, audio_path):
+        """
+        Analyze an audio sample to extract basic voice characteristics.
+        
+        :param audio_path: Path to the audio sample
+        :return: Dictionary containing basic voice characteristics
+        """
+        # The first five seconds at 16 kHz are plenty to characterise a voice
+        with sf.SoundFile(audio_path) as f:
+            y = f.read(frames=int(5.0 * f.samplerate), dtype='float32', always_2d=False)
+            orig_sr = f.samplerate
+        if y.ndim == 2:
+            y = y.mean(axis=1)
+        sr = 16000
+        if orig_sr != sr:
+            y = resampy.resample(y, orig_sr, sr)
+        pitch = librosa.pitch_tuning(y)
+        
+        # Only a global tempo is needed, so skip the beat tracker and read it off the onset envelope
+        onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+        tempo = float(librosa.feature.tempo(onset_envelope=onset_env, sr=sr)[0])
+        
+        return {
+            "pitch": pitch,
+            "tempo": tempo
+        }
+
+    def generate_with_cloned_voice(self, text_prompt, voice_characteristics, output_path):
+        """
+        Generate audio using simple voice conversion.
+        
+        :param text_prompt: The text to convert to speech
+        :param voice_characteristics: Dictionary containing voice characteristics
+        :param output_path: Path to save the generated audio
+        :return: Audio array
+        """
+        base_audio = self.generate_audio(text_prompt)
+        converted_audio = self.simple_voice_conversion(base_audio, voice_characteristics)
+        self.save_audio(converted_audio, output_path)
+        
+        return converted_audio
 
-    def simple_voice_conversion(self, audio, characteristics):
+    def simple_voice_conversion(self, audio, characteristics, return_dtype=np.float32):
         """
         Apply simple voice conversion based on pitch and tempo.
         
-        :param audio: Input audio array
+        :param audio: Input audio array (float or int16)
         :param characteristics: Dictionary containing voice characteristics (pitch and/or tempo)
+        :param return_dtype: Data type of the result; float32 in [-1, 1] by default, or np.int16
         :return: Converted audio array
         """
-        # Convert audio to floating point and normalize
-        audio_float = librosa.util.normalize(audio.astype(np.float32))
+        # Normalize to a peak of 1, converting int input to float32 in the same pass
+        peak = max(abs(float(audio.min())), abs(float(audio.max()))) if len(audio) else 0.0
+        audio_float = np.divide(audio, peak or 1.0, dtype=np.float32)
+        
+        n_steps = characteristics.get('pitch', 0) * 12  # Convert octaves to semitones
+        pitch_rate = 2 ** (n_steps / 12)
+        rate = characteristics.get('tempo', 100) / 100.0  # Assuming 100 is the base tempo
         
-        # Pitch shift
-        if 'pitch' in characteristics:
-            n_steps = characteristics['pitch'] * 12  # Convert octaves to semitones
-            audio_converted = librosa.effects.pitch_shift(audio_float, sr=self.SAMPLE_RATE, n_steps=n_steps)
+        # Pitch shift by resampling, which also changes the duration by 1 / pitch_rate
+        if pitch_rate != 1:
+            audio_converted = resampy.resample(audio_float, self.SAMPLE_RATE, int(self.SAMPLE_RATE / pitch_rate))
         else:
             audio_converted = audio_float
         
-        # Tempo adjustment
-        if 'tempo' in characteristics:
-            rate = characteristics['tempo'] / 100.0  # Assuming 100 is the base tempo
-            audio_converted = librosa.effects.time_stretch(audio_converted, rate=rate)
+        # Undo that duration change and apply the tempo adjustment in a single time stretch
+        stretch_rate = rate / pitch_rate
+        if stretch_rate != 1:
+            audio_converted = _sola_stretch(audio_converted, stretch_rate)
+        
+        if np.dtype(return_dtype) != np.int16:
+            return audio_converted.astype(return_dtype, copy=False)
+        
+        # audio_converted is always a fresh array by now, so scale, clip and round it in place
+        # and only allocate the int16 result
+        np.multiply(audio_converted, 32767.0, out=audio_converted)
+        np.clip(audio_converted, -32768, 32767, out=audio_converted)
+        np.rint(audio_converted, out=audio_converted)
+        
+        return audio_converted.astype(np.int16)
+    
+    def custom_time_stretch(self, audio, rate):
+        """
+        Custom time stretching function using resampling.
         
-        # Ensure the output has the same data type as the input
-        audio_converted = (audio_converted * 32767).astype(np.int16)
+        :param audio: Input audio array
+        :param rate: Time stretch rate
+        :return: Time-stretched audio array
+        """
+        # Linear interpolation is plenty for a coarse tempo control and avoids building a sinc filter per call
+        new_length = int(len(audio) / rate)
+        # Keep the sample positions in float64: float32 can't represent indices past 2**24 exactly
+        x_old = np.arange(len(audio))
+        x_new = np.linspace(0, len(audio) - 1, new_length)
+        return np.interp(x_new, x_old, audio).astype(np.float32)
+
+    @staticmethod
+    def list_supported_languages():
+        """
+        List all supported languages by Bark.
         
-        return audio_converted
+        :return: Dictionary of supported languages
+        """
+        return {
+            "en": "English",
+            "de": "German",
+            "es": "Spanish",
+            "fr": "French",
+            "hi": "Hindi",
+            "it": "Italian",
+            "ja": "Japanese",
+            "ko": "Korean",
+            "pl": "Polish",
+            "pt": "Portuguese",
+            "ru": "Russian",
+            "tr": "Turkish",
+            "zh": "Chinese (Simplified)"
+        }
     
     def _split_long_text(self, text, max_length=100):
         words = text.split()
         chunks = []
         current_chunk = []
+        current_length = 0
         
         for word in words:
-            if len(' '.join(current_chunk + [word])) > max_length:
+            # Length the chunk would have with this word appended, counting the joining space
+            added_length = len(word) + (1 if current_chunk else 0)
+            if current_chunk and current_length + added_length > max_length:
                 chunks.append(' '.join(current_chunk))
                 current_chunk = [word]
+                current_length = len(word)
             else:
                 current_chunk.append(word)
+                current_length += added_length
         
         if current_chunk:
             chunks.append(' '.join(current_chunk))
@@ -13,6 +13,7 @@ class ExpandedJBarkTestSuite:
 
     def run_tests(self):
         self.test_audio_generation_variations()
+        self.test_batch_generation()
         self.test_voice_cloning_variations()
         self.test_voice_conversion_variations()
         self.test_language_support()
@@ -43,6 +44,25 @@ class ExpandedJBarkTestSuite:
             audio = self.jbark.generate_audio(text, output_path, history_prompt=prompt)
             print(f"Generated audio with history prompt {prompt}. Shape: {audio.shape}")
 
+    def test_batch_generation(self):
+        print("\nTesting batch generation...")
+        
+        texts = [
+            "This is the first sentence of the batch.",
+            "Here is a second, slightly longer sentence in the same batch.",
+            "And a third."
+        ]
+        
+        start_time = time.time()
+        audios = self.jbark.generate_audio_batch(texts, history_prompt="v2/en_speaker_6")
+        end_time = time.time()
+        
+        for i, audio in enumerate(audios):
+            output_path = os.path.join(self.test_output_dir, f"test_batch_{i}.wav")
+            wavfile.write(output_path, SAMPLE_RATE, audio)
+            print(f"Generated batch audio {i}. Shape: {audio.shape}")
+        print(f"Batch of {len(texts)} generated in {end_time - start_time:.2f} seconds")
+
     def test_voice_cloning_variations(self):
         print("\nTesting voice cloning variations...")
         
@@ -88,6 +108,13 @@ class ExpandedJBarkTestSuite:
             output_path = os.path.join(self.test_output_dir, f"converted_voice_{i}.wav")
             wavfile.write(output_path, SAMPLE_RATE, converted_audio)
             print(f"Generated converted audio with pitch {vars['pitch']} and tempo {vars['tempo']}. Shape: {converted_audio.shape}")
+        
+        # Slowing audio down must stay finite and within the normalized range
+        for tempo in [30, 50, 80]:
+            converted_audio = self.jbark.simple_voice_conversion(base_audio, {"pitch": 0, "tempo": tempo})
+            assert np.all(np.isfinite(converted_audio)), f"Non-finite samples at tempo {tempo}"
+            assert np.abs(converted_audio).max() <= 1.0, f"Peak above 1.0 at tempo {tempo}"
+            print(f"Slow-down at tempo {tempo} stayed finite. Peak: {np.abs(converted_audio).max():.3f}")
 
     def test_language_support(self):
         print("\nTesting language support...")